@@ -13,6 +13,37 @@ from mcipy.models import Tool
 from mci.utils.timestamp import generate_timestamp_filename, get_iso_timestamp
 
 
+def _build_tool_dict(tool: Tool, verbose: bool) -> dict[str, Any]:
+    """
+    Build the JSON-serializable entry for a single tool.
+
+    Args:
+        tool: Tool object to serialize
+        verbose: Whether to include tags, execution type, input schema and disabled flag
+
+    Returns:
+        Dictionary with the tool's exported fields
+    """
+    tool_data: dict[str, Any] = {
+        "name": tool.name,
+        "source": tool.toolset_source or "main",
+        "description": tool.description or "",
+    }
+
+    # Add verbose fields if requested
+    if verbose:
+        tool_data["tags"] = tool.tags
+        tool_data["execution_type"] = tool.execution.type.value
+
+        if tool.inputSchema:
+            tool_data["inputSchema"] = tool.inputSchema
+
+        if tool.disabled:
+            tool_data["disabled"] = tool.disabled
+
+    return tool_data
+
+
 class JSONFormatter:
     """
     Formats tool information as JSON files with metadata.
@@ -58,34 +89,9 @@ class JSONFormatter:
             "mci_file": mci_file,
             "filters_applied": filters_applied or [],
             "total": len(tools),
-            "tools": [],
+            "tools": [_build_tool_dict(tool, verbose) for tool in tools],
         }
 
-        # Format each tool
-        for tool in tools:
-            tool_data: dict[str, str | list[str] | dict[str, Any] | bool] = {
-                "name": tool.name,
-                "source": tool.toolset_source or "main",
-                "description": tool.description or "",
-            }
-
-            # Add verbose fields if requested
-            if verbose:
-                tool_data["tags"] = tool.tags
-                tool_data["execution_type"] = (
-                    tool.execution.type.value
-                    if hasattr(tool.execution.type, "value")
-                    else str(tool.execution.type)
-                )
-
-                if tool.inputSchema:
-                    tool_data["inputSchema"] = tool.inputSchema
-
-                if tool.disabled:
-                    tool_data["disabled"] = tool.disabled
-
-            output_data["tools"].append(tool_data)
-
         # Write to file
         with open(filename, "w") as f:
             json.dump(output_data, f, indent=2)
@@ -75,6 +75,29 @@ class TableFormatter:
 
         return table
 
+    @staticmethod
+    def format_plain(tools: list[Tool]) -> str:
+        """
+        Format tools as plain tab-separated text without Rich styling.
+
+        Intended for piping into other tools (grep, cut, awk). Skips Rich's
+        table layout entirely. Tabs and newlines inside descriptions are
+        replaced with spaces so each tool stays on one line.
+
+        Args:
+            tools: List of Tool objects to format
+
+        Returns:
+            Header line followed by one `name<TAB>source<TAB>description` line per tool
+        """
+        lines = ["Name\tSource\tDescription"]
+        lines.extend(
+            f"{tool.name}\t{tool.toolset_source or 'main'}\t"
+            + (tool.description or "").replace("\t", " ").replace("\n", " ")
+            for tool in tools
+        )
+        return "\n".join(lines)
+
     @staticmethod
     def format_verbose(tools: list[Tool]) -> list[str]:
         """
@@ -109,24 +132,18 @@ class TableFormatter:
                 output_lines.append(f"├── Tags: {escape(f'[{tags_str}]')}")
 
             # Execution type
-            execution_type = (
-                tool.execution.type.value
-                if hasattr(tool.execution.type, "value")
-                else str(tool.execution.type)
-            )
-            output_lines.append(f"├── Execution: {execution_type}")
+            output_lines.append(f"├── Execution: {tool.execution.type.value}")
 
             # Parameters from inputSchema
-            if tool.inputSchema and "properties" in tool.inputSchema:
-                params = tool.inputSchema["properties"]
-                required = tool.inputSchema.get("required", [])
-
-                param_strs = []
-                for param_name, param_def in params.items():
-                    param_type = param_def.get("type", "any")
-                    is_required = param_name in required
-                    req_indicator = "" if is_required else " (optional)"
-                    param_strs.append(f"{param_name} ({param_type}){req_indicator}")
+            schema = tool.inputSchema
+            if schema and (params := schema.get("properties")) is not None:
+                required = frozenset(schema.get("required", ()))
+
+                param_strs = [
+                    f"{param_name} ({param_def.get('type', 'any')})"
+                    + ("" if param_name in required else " (optional)")
+                    for param_name, param_def in params.items()
+                ]
 
                 if param_strs:
                     output_lines.append(f"└── Parameters: {', '.join(param_strs)}")
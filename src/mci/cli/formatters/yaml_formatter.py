@@ -5,13 +5,49 @@ This module provides formatting for outputting tools to YAML files
 with metadata including timestamp, source file, filters, and tool count.
 """
 
-from typing import Any
+import json
+import re
+from typing import Any, TextIO
 
 import yaml
 from mcipy.models import Tool
 
 from mci.utils.timestamp import generate_timestamp_filename, get_iso_timestamp
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Characters JSON leaves unescaped but YAML rejects or treats as line breaks
+# inside double-quoted scalars
+_YAML_UNSAFE_CHARS = re.compile("[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff]")
+
+
+def _quote(value: Any) -> str:
+    """Render a scalar as YAML; JSON scalars are valid YAML flow scalars."""
+    return _YAML_UNSAFE_CHARS.sub(
+        lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False)
+    )
+
+
+def _write_scalar(f: TextIO, key: str, value: Any, prefix: str = "") -> None:
+    """Write a `key: value` line for a scalar value."""
+    f.write(f"{prefix}{key}: {_quote(value)}\n")
+
+
+def _write_list(f: TextIO, key: str, items: list[Any], prefix: str = "") -> None:
+    """Write a block sequence of scalars under `key`, aligned with the key."""
+    if not items:
+        f.write(f"{prefix}{key}: []\n")
+        return
+
+    indent = " " * len(prefix)
+    f.write(f"{prefix}{key}:\n")
+    for item in items:
+        f.write(f"{indent}- {_quote(item)}\n")
+
 
 class YAMLFormatter:
     """
@@ -52,42 +88,43 @@ class YAMLFormatter:
         # Generate timestamped filename
         filename = generate_timestamp_filename("yaml")
 
-        # Build output data structure
-        output_data: dict[str, Any] = {
-            "timestamp": get_iso_timestamp(),
-            "mci_file": mci_file,
-            "filters_applied": filters_applied or [],
-            "total": len(tools),
-            "tools": [],
-        }
-
-        # Format each tool
-        for tool in tools:
-            tool_data: dict[str, str | list[str] | dict[str, Any] | bool] = {
-                "name": tool.name,
-                "source": tool.toolset_source or "main",
-                "description": tool.description or "",
-            }
-
-            # Add verbose fields if requested
-            if verbose:
-                tool_data["tags"] = tool.tags
-                tool_data["execution_type"] = (
-                    tool.execution.type.value
-                    if hasattr(tool.execution.type, "value")
-                    else str(tool.execution.type)
-                )
-
-                if tool.inputSchema:
-                    tool_data["inputSchema"] = tool.inputSchema
-
-                if tool.disabled:
-                    tool_data["disabled"] = tool.disabled
-
-            output_data["tools"].append(tool_data)
-
-        # Write to file
-        with open(filename, "w") as f:
-            yaml.dump(output_data, f, default_flow_style=False, sort_keys=False)
+        # The document shape is fixed, so it is written directly rather than
+        # going through PyYAML's generic representer and emitter. Only the
+        # free-form inputSchema is handed to yaml.dump.
+        with open(filename, "w", encoding="utf-8") as f:
+            _write_scalar(f, "timestamp", get_iso_timestamp())
+            _write_scalar(f, "mci_file", mci_file)
+            _write_list(f, "filters_applied", filters_applied or [])
+            _write_scalar(f, "total", len(tools))
+
+            if not tools:
+                f.write("tools: []\n")
+                return filename
+
+            f.write("tools:\n")
+            for tool in tools:
+                _write_scalar(f, "name", tool.name, "- ")
+                _write_scalar(f, "source", tool.toolset_source or "main", "  ")
+                _write_scalar(f, "description", tool.description or "", "  ")
+
+                # Add verbose fields if requested
+                if verbose:
+                    _write_list(f, "tags", tool.tags, "  ")
+                    _write_scalar(f, "execution_type", tool.execution.type.value, "  ")
+
+                    input_schema = tool.inputSchema
+                    if input_schema:
+                        # Flow style on a single line so it nests under the key
+                        schema_yaml = yaml.dump(
+                            input_schema,
+                            Dumper=_Dumper,
+                            default_flow_style=True,
+                            sort_keys=False,
+                            width=1 << 30,
+                        )
+                        f.write(f"  inputSchema: {schema_yaml}")
+
+                    if tool.disabled:
+                        _write_scalar(f, "disabled", tool.disabled, "  ")
 
         return filename
@@ -43,7 +43,12 @@ from mci.utils.error_handler import ErrorHandler
     is_flag=True,
     help="Show detailed tool information including tags, parameters, etc.",
 )
-def list_command(file: str | None, filter: str | None, format: str, verbose: bool):
+@click.option(
+    "--plain",
+    is_flag=True,
+    help="Print tab-separated text instead of a Rich table (for piping; not with --verbose or --format)",
+)
+def list_command(file: str | None, filter: str | None, format: str, verbose: bool, plain: bool):
     """
     List available tools from the MCI configuration.
 
@@ -68,12 +73,19 @@ def list_command(file: str | None, filter: str | None, format: str, verbose: boo
         # List tools with verbose output
         mcix list --verbose
 
+        # Tab-separated output for scripts
+        mcix list --plain | cut -f1
+
         # Export tools to JSON file
         mcix list --format=json
 
         # Export tools to YAML file with verbose info
         mcix list --format=yaml --verbose
     """
+    # --plain only replaces the basic table; reject combinations it would ignore
+    if plain and (verbose or format != "table"):
+        raise click.UsageError("--plain cannot be combined with --verbose or --format json/yaml")
+
     console = Console()
 
     try:
@@ -110,13 +122,17 @@ def list_command(file: str | None, filter: str | None, format: str, verbose: boo
             tools = client.get_tools()
 
         # Format and display output
-        if format == "table":
+        if format == "table" and plain:
+            # Plain tab-separated text, no Rich layout or styling
+            click.echo(TableFormatter.format_plain(tools))
+
+        elif format == "table":
             # Display table to console
             output = TableFormatter.format(tools, verbose=verbose)
             if isinstance(output, list):
-                # Verbose mode returns list of Rich markup strings
-                for line in output:
-                    console.print(line)
+                # Verbose mode returns list of Rich markup strings; render them
+                # in a single print call rather than one per line
+                console.print("\n".join(output))
             else:
                 # Basic mode returns a Table object
                 console.print(output)
@@ -7,11 +7,89 @@ and provides user-friendly error messages. It also automatically loads environme
 variables from .env files in the project root and ./mci directory.
 """
 
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from mcipy import MCIClient, MCIClientError
 
 from mci.utils.dotenv import get_env_with_dotenv
+from mci.utils.hashing import schema_digest
+
+# Clients already built in this process, keyed by the schema file's identity
+# (path, mtime, size) and a digest of the resolved environment. Only clients
+# whose tools come entirely from the schema file itself are cached; least
+# recently used entries are evicted once the cache is full.
+_CLIENT_CACHE_MAX_SIZE = 16
+_CLIENT_CACHE: OrderedDict[tuple[object, ...], MCIClient] = OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _is_cacheable(client: MCIClient) -> bool:
+    """
+    Check whether a client's tools depend only on its main schema file.
+
+    Toolsets are read from separate files in the library directory and MCP
+    server tools come from their own cache, so neither is covered by the main
+    file's mtime and size.
+
+    Args:
+        client: A fully loaded MCIClient
+
+    Returns:
+        True if the client declares no toolsets and no MCP servers
+    """
+    # mci-py exposes no public accessor for the parsed schema
+    schema = client._schema  # pyright: ignore[reportPrivateUsage]
+    return not schema.toolsets and not schema.mcp_servers
+
+
+def _get_client(file_path: str, env_vars: dict[str, str]) -> MCIClient:
+    """
+    Return an MCIClient for the schema file, reusing a cached one when possible.
+
+    A client is reused only while the schema file is unchanged (same mtime and
+    size), the environment it is resolved against is identical, and the schema
+    declares no toolsets or MCP servers.
+
+    Args:
+        file_path: Path to the MCI schema file
+        env_vars: Fully merged environment variables for template substitution
+
+    Returns:
+        An initialized MCIClient instance
+
+    Raises:
+        MCIClientError: If the schema file cannot be loaded or parsed
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let MCIClient report the missing or unreadable file
+        return MCIClient(schema_file_path=file_path, env_vars=env_vars)
+
+    cache_key = (
+        file_path,
+        os.path.abspath(file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        schema_digest(env_vars),
+    )
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is not None:
+            _CLIENT_CACHE.move_to_end(cache_key)
+            return client
+
+    client = MCIClient(schema_file_path=file_path, env_vars=env_vars)
+    if _is_cacheable(client):
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE[cache_key] = client
+            _CLIENT_CACHE.move_to_end(cache_key)
+            if len(_CLIENT_CACHE) > _CLIENT_CACHE_MAX_SIZE:
+                _CLIENT_CACHE.popitem(last=False)
+    return client
 
 
 class MCIConfig:
@@ -39,6 +117,9 @@ class MCIConfig:
 
         This method uses MCIClient from mci-py to load and validate the schema.
         The MCIClient performs comprehensive schema validation during initialization.
+        Clients are cached per process, so loading an unchanged file with the same
+        environment again returns the already-built client. Schemas that declare
+        toolsets or MCP servers are never cached.
 
         If auto_load_dotenv is True (default), automatically loads environment variables
         from .env and .env.mci files. Priority order:
@@ -84,8 +165,7 @@ class MCIConfig:
                 # If auto-loading is disabled, just use provided env_vars
                 merged_env = env_vars or {}
 
-            client = MCIClient(schema_file_path=file_path, env_vars=merged_env)
-            return client
+            return _get_client(file_path, merged_env)
         except MCIClientError:
             # Re-raise with the original error message from mci-py
             raise
@@ -121,6 +201,35 @@ class MCIConfig:
             >>> if not is_valid:
             ...     print(f"Validation failed: {error}")
         """
+        is_valid, error_message, _ = MCIConfig.validate_schema_with_client(
+            file_path, env_vars, auto_load_dotenv
+        )
+        return (is_valid, error_message)
+
+    @staticmethod
+    def validate_schema_with_client(
+        file_path: str, env_vars: dict[str, str] | None = None, auto_load_dotenv: bool = True
+    ) -> tuple[bool, str, MCIClient | None]:
+        """
+        Validate an MCI schema file and return the validation-only client.
+
+        Behaves like validate_schema, but also returns the MCIClient built during
+        validation so callers can inspect the parsed schema without loading the
+        file (and resolving .env files) a second time.
+
+        Args:
+            file_path: Path to the MCI schema file to validate
+            env_vars: Optional environment variables for template substitution
+            auto_load_dotenv: Whether to automatically load .env files (default: True)
+
+        Returns:
+            A tuple of (is_valid, error_message, client) where client is the
+            validation-only MCIClient if the schema is valid, or None otherwise
+
+        Example:
+            >>> config = MCIConfig()
+            >>> is_valid, error, client = config.validate_schema_with_client("mci.json")
+        """
         try:
             # Determine project root from schema file location
             project_root = Path(file_path).parent.resolve()
@@ -134,11 +243,13 @@ class MCIConfig:
 
             # Use validating=True to skip template resolution for MCP servers
             # This allows validation without requiring all env_vars at validation time
-            MCIClient(schema_file_path=file_path, env_vars=merged_env, validating=True)
-            return (True, "")
+            # Validation-only clients are never cached, since validation also
+            # checks that referenced toolset files still exist
+            client = MCIClient(schema_file_path=file_path, env_vars=merged_env, validating=True)
+            return (True, "", client)
         except MCIClientError as e:
-            return (False, str(e))
+            return (False, str(e), None)
         except FileNotFoundError:
-            return (False, f"File not found: {file_path}")
+            return (False, f"File not found: {file_path}", None)
         except Exception as e:
-            return (False, f"Unexpected error: {str(e)}")
+            return (False, f"Unexpected error: {str(e)}", None)
@@ -7,12 +7,10 @@ while providing CLI-specific error handling and output formatting. It also suppo
 automatic loading of environment variables from .env files.
 """
 
-from pathlib import Path
-
 from mcipy import MCIClient
 from mcipy.models import Tool
 
-from mci.utils.dotenv import get_env_with_dotenv
+from mci.core.config import MCIConfig
 
 
 class MCIClientWrapper:
@@ -54,17 +52,7 @@ class MCIClientWrapper:
         Raises:
             MCIClientError: If the schema file cannot be loaded or parsed
         """
-        # Determine project root from schema file location
-        project_root = Path(file_path).parent.resolve()
-
-        # Load environment variables with proper precedence
-        if auto_load_dotenv:
-            merged_env = get_env_with_dotenv(project_root, env_vars)
-        else:
-            # If auto-loading is disabled, just use provided env_vars
-            merged_env = env_vars or {}
-
-        self._client: MCIClient = MCIClient(schema_file_path=file_path, env_vars=merged_env)
+        self._client: MCIClient = MCIConfig.load(file_path, env_vars, auto_load_dotenv)
         self._file_path: str = file_path
 
     @property
@@ -6,11 +6,22 @@ to MCP tool format compatible with the MCP protocol. It handles schema conversio
 metadata preservation, and ensures proper formatting for MCP servers.
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import mcp.types as types
 from mcipy.models import Tool
 
+from mci.utils.hashing import schema_digest
+
+# Converted MCP tools, keyed by every MCI field that feeds into them. Least
+# recently used entries are evicted so that long-running processes converting
+# many schemas don't grow it forever.
+_MCP_TOOL_CACHE_MAX_SIZE = 1024
+_MCP_TOOL_CACHE: OrderedDict[tuple[Any, ...], types.Tool] = OrderedDict()
+_MCP_TOOL_CACHE_LOCK = threading.Lock()
+
 
 class MCIToolConverter:
     """
@@ -29,6 +40,10 @@ class MCIToolConverter:
         expected by the MCP protocol. This includes converting the input schema,
         preserving all metadata, and transferring annotations.
 
+        Conversions are cached, so converting an identical tool again returns the
+        same types.Tool instance without re-running Pydantic validation. Callers
+        must treat the returned object as read-only.
+
         Args:
             mci_tool: Tool object from mci-py (Pydantic model)
 
@@ -40,20 +55,48 @@ class MCIToolConverter:
             >>> mcp_tool = converter.convert_to_mcp_tool(mci_tool)
             >>> print(mcp_tool.name, mcp_tool.description)
         """
+        annotations_source = mci_tool.annotations
+        try:
+            cache_key: tuple[Any, ...] | None = (
+                mci_tool.name,
+                mci_tool.description,
+                schema_digest(mci_tool.inputSchema),
+                None if annotations_source is None else annotations_source.model_dump_json(),
+            )
+        except (TypeError, ValueError):
+            # Schema can't be serialized to a key (e.g. mixed key types); skip the cache
+            cache_key = None
+
+        if cache_key is not None:
+            with _MCP_TOOL_CACHE_LOCK:
+                cached = _MCP_TOOL_CACHE.get(cache_key)
+                if cached is not None:
+                    _MCP_TOOL_CACHE.move_to_end(cache_key)
+                    return cached
+
         # Convert inputSchema to MCP format (JSON Schema)
         input_schema = MCIToolConverter.convert_input_schema(mci_tool.inputSchema or {})
 
         # Convert annotations to MCP format
-        annotations = MCIToolConverter.convert_annotations(mci_tool.annotations)
+        annotations = MCIToolConverter.convert_annotations(annotations_source)
 
         # Create MCP Tool with converted schema and annotations
-        return types.Tool(
+        mcp_tool = types.Tool(
             name=mci_tool.name,
             description=mci_tool.description or "",
             inputSchema=input_schema,
             annotations=annotations,
         )
 
+        if cache_key is not None:
+            with _MCP_TOOL_CACHE_LOCK:
+                _MCP_TOOL_CACHE[cache_key] = mcp_tool
+                _MCP_TOOL_CACHE.move_to_end(cache_key)
+                if len(_MCP_TOOL_CACHE) > _MCP_TOOL_CACHE_MAX_SIZE:
+                    _MCP_TOOL_CACHE.popitem(last=False)
+
+        return mcp_tool
+
     @staticmethod
     def convert_input_schema(mci_schema: dict[str, Any]) -> dict[str, Any]:
         """
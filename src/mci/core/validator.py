@@ -6,17 +6,20 @@ leveraging mci-py's built-in MCIClient validation and adding
 additional checks for toolset files and MCP command availability.
 """
 
-import json
+import os
 import shutil
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any
 
-import yaml
+from mcipy import MCIClient
 
 from mci.core.config import MCIConfig
 from mci.utils.error_formatter import ValidationError, ValidationWarning
 
+# Results of MCP command lookups, keyed by (PATH value, command), shared across
+# validator runs in the same process
+_WHICH_CACHE: dict[tuple[str, str], bool] = {}
+
 
 @dataclass
 class ValidationResult:
@@ -76,17 +79,20 @@ class MCIValidator:
 
         # First, validate using MCIClient (primary validation)
         config = MCIConfig()
-        is_valid, error_message = config.validate_schema(self.file_path, self.env_vars)
+        is_valid, error_message, client = config.validate_schema_with_client(
+            self.file_path, self.env_vars
+        )
 
-        if not is_valid:
+        if not is_valid or client is None:
             # Parse the error message from MCIClient
             errors.append(ValidationError(message=error_message))
             # If schema is invalid, we can't perform additional checks
             return ValidationResult(errors=errors, warnings=warnings, is_valid=False)
 
-        # Load schema data for additional checks
+        # Load schema data for additional checks from the schema the
+        # validation client already parsed
         try:
-            self._load_schema_data()
+            self._load_schema_data(client)
         except Exception as e:
             errors.append(ValidationError(message=f"Failed to load schema data: {str(e)}"))
             return ValidationResult(errors=errors, warnings=warnings, is_valid=False)
@@ -97,27 +103,19 @@ class MCIValidator:
 
         return ValidationResult(errors=errors, warnings=warnings, is_valid=True)
 
-    def _load_schema_data(self) -> None:
+    def _load_schema_data(self, client: MCIClient) -> None:
         """
-        Load the raw schema data from the file.
+        Load the schema data used for additional checks.
 
-        This is used for additional validation checks beyond what MCIClient provides.
+        The schema already parsed by the validation client is reused instead of
+        reading the file again.
 
-        Raises:
-            Exception: If the file cannot be loaded or parsed
+        Args:
+            client: MCIClient that has already loaded this schema file
         """
-        file_path = Path(self.file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {self.file_path}")
-
-        with open(file_path) as f:
-            if file_path.suffix == ".json":
-                self.schema_data = json.load(f)
-            elif file_path.suffix in [".yaml", ".yml"]:
-                self.schema_data = yaml.safe_load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path.suffix}")
+        # mci-py exposes no public accessor for the parsed schema
+        schema = client._schema  # pyright: ignore[reportPrivateUsage]
+        self.schema_data = schema.model_dump(exclude_none=True)
 
     def check_mcp_commands(self) -> list[ValidationWarning]:
         """
@@ -128,7 +126,7 @@ class MCIValidator:
 
         Example:
             >>> validator = MCIValidator("mci.json")
-            >>> validator._load_schema_data()
+            >>> validator.validate_schema()
             >>> warnings = validator.check_mcp_commands()
         """
         warnings: list[ValidationWarning] = []
@@ -151,7 +149,7 @@ class MCIValidator:
                 if command:
                     # Check if command is available in PATH
                     # Ensure command is a string (not PathLike) to avoid deprecation warning
-                    if not shutil.which(str(command)):
+                    if not self._is_command_available(str(command)):
                         warnings.append(
                             ValidationWarning(
                                 message=f"MCP server command not found in PATH: {command} (server: {server_name})",
@@ -160,3 +158,23 @@ class MCIValidator:
                         )
 
         return warnings
+
+    def _is_command_available(self, command: str) -> bool:
+        """
+        Check whether a command can be found on PATH using shutil.which.
+
+        Results are cached per PATH value, so repeated validations in the same
+        process answer known commands without touching the filesystem.
+
+        Args:
+            command: Command name or path to look up
+
+        Returns:
+            True if the command resolves to an executable
+        """
+        key = (os.environ.get("PATH", os.defpath), command)
+        found = _WHICH_CACHE.get(key)
+        if found is None:
+            found = shutil.which(command) is not None
+            _WHICH_CACHE[key] = found
+        return found
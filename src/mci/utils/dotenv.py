@@ -16,10 +16,26 @@ configuration.
 """
 
 import os
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from dotenv import dotenv_values
 
+# Parsed .env files, keyed by absolute path and validated against the file's
+# (mtime_ns, size) so unchanged files are not re-read on repeated loads. Files
+# with "$" in a value are stored with None instead of their values, because
+# ${VAR} interpolation depends on os.environ, which the key does not cover.
+# Least recently used entries are evicted once the cache is full.
+_PARSE_CACHE_MAX_SIZE = 64
+_PARSE_CACHE: OrderedDict[str, tuple[int, int, dict[str, str] | None]] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Candidate .env file names, most specific first. Only the first name found in
+# either the project root or ./mci is loaded.
+_DOTENV_FILENAMES = (".env.mci", ".env")
+
 
 def parse_dotenv_file(file_path: str | Path) -> dict[str, str]:
     """
@@ -33,6 +49,11 @@ def parse_dotenv_file(file_path: str | Path) -> dict[str, str]:
     - Values can be quoted with single or double quotes
     - Variable expansion and interpolation (if needed)
 
+    Results are cached per file and reused while the file's modification time
+    and size are unchanged. Files whose values contain "$" are parsed again on
+    every call, since ${VAR} references are resolved against os.environ. Each
+    call returns a fresh dictionary.
+
     Args:
         file_path: Path to the .env file to parse
 
@@ -46,19 +67,69 @@ def parse_dotenv_file(file_path: str | Path) -> dict[str, str]:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    try:
+        stat = file_path.stat()
+    except OSError:
+        # Missing file is not an error
         return {}
 
+    if stat.st_size == 0:
+        # Placeholder .env files are common; nothing to open or parse
+        return {}
+
+    cache_key = os.path.abspath(file_path)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _PARSE_CACHE.move_to_end(cache_key)
+            if cached[2] is not None:
+                return dict(cached[2])
+            # The file uses ${VAR} interpolation, so its values depend on os.environ
+            return _parse_uncached(file_path) or {}
+
+    parsed = _parse_uncached(file_path, interpolate=False)
+    if parsed is None:
+        return {}
+    # Values containing "$" may be interpolated from os.environ, which the
+    # (mtime, size) key does not cover; record the file but not its values
+    interpolated = any("$" in value for value in parsed.values())
+    if interpolated:
+        parsed = _parse_uncached(file_path) or {}
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[cache_key] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            None if interpolated else parsed,
+        )
+        _PARSE_CACHE.move_to_end(cache_key)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAX_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return dict(parsed)
+
+
+def _parse_uncached(file_path: Path, interpolate: bool = True) -> dict[str, str] | None:
+    """Parse a .env file with python-dotenv, returning None if it can't be read."""
     try:
         # Use dotenv_values to parse the file
         # This returns a dict with all variables, including None for empty values
-        env_dict = dotenv_values(file_path)
-        # Filter out None values and convert to strings
-        return {k: str(v) for k, v in env_dict.items() if v is not None}
+        env_dict = dotenv_values(file_path, interpolate=interpolate)
     except (OSError, UnicodeDecodeError):
-        # If we can't read the file, return empty dict (silent failure)
-        # This maintains the "no error if .env is missing" requirement
-        return {}
+        # If we can't read the file, the caller returns an empty dict (silent
+        # failure). This maintains the "no error if .env is missing" requirement
+        return None
+    # Filter out None values and convert to strings. Keys are interned since
+    # the same names recur across files and merged environments.
+    return {sys.intern(k): str(v) for k, v in env_dict.items() if v is not None}
+
+
+def _names_in(dir_path: Path) -> set[str]:
+    """Return the entry names in a directory, or an empty set if it can't be listed."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 def find_and_merge_dotenv_files(project_root: str | Path | None = None) -> dict[str, str]:
@@ -87,42 +158,28 @@ def find_and_merge_dotenv_files(project_root: str | Path | None = None) -> dict[
     """
     if project_root is None:
         project_root = Path.cwd()
-    else:
+    elif not isinstance(project_root, Path):
+        # MCIConfig already passes a resolved Path; only wrap plain strings
         project_root = Path(project_root)
 
     merged_env: dict[str, str] = {}
 
-    # Check for .env.mci files first (MCI-specific configs)
-    mci_env_mci_path = project_root / "mci" / ".env.mci"
-    root_env_mci_path = project_root / ".env.mci"
-
-    has_env_mci = mci_env_mci_path.exists() or root_env_mci_path.exists()
-
-    if has_env_mci:
-        # Priority order for .env.mci files (lowest to highest):
-        # 1. ./mci/.env.mci (library MCI-specific)
-        if mci_env_mci_path.exists():
-            mci_env_mci_vars = parse_dotenv_file(mci_env_mci_path)
-            merged_env.update(mci_env_mci_vars)
-
-        # 2. .env.mci (project root MCI-specific - highest priority)
-        if root_env_mci_path.exists():
-            root_env_mci_vars = parse_dotenv_file(root_env_mci_path)
-            merged_env.update(root_env_mci_vars)
-    else:
-        # No .env.mci files found, check for .env files
-        # Priority order for .env files (lowest to highest):
-        # 1. ./mci/.env (library defaults)
-        mci_env_path = project_root / "mci" / ".env"
-        if mci_env_path.exists():
-            mci_env_vars = parse_dotenv_file(mci_env_path)
-            merged_env.update(mci_env_vars)
-
-        # 2. .env (project root - higher priority)
-        root_env_path = project_root / ".env"
-        if root_env_path.exists():
-            root_env_vars = parse_dotenv_file(root_env_path)
-            merged_env.update(root_env_vars)
+    # One directory listing each instead of a stat per candidate file
+    root_names = _names_in(project_root)
+    mci_dir = project_root / "mci"
+    mci_names = _names_in(mci_dir) if "mci" in root_names else set()
+
+    # Use the first file family present in either directory (.env.mci before .env)
+    env_filename = next(
+        (name for name in _DOTENV_FILENAMES if name in mci_names or name in root_names), None
+    )
+    if env_filename is None:
+        return merged_env
+
+    # Priority order (lowest to highest): ./mci/<file>, then <project_root>/<file>
+    for directory, names in ((mci_dir, mci_names), (project_root, root_names)):
+        if env_filename in names:
+            merged_env.update(parse_dotenv_file(directory / env_filename))
 
     return merged_env
 
@@ -157,14 +214,6 @@ def get_env_with_dotenv(
         >>> # Add custom vars that override everything
         >>> env_vars = get_env_with_dotenv(additional_env={"API_KEY": "override"})
     """
-    # Start with .env files (lowest priority)
-    merged_env = find_and_merge_dotenv_files(project_root)
-
-    # Merge with system environment variables (higher priority)
-    merged_env.update(os.environ)
-
-    # Merge with additional environment variables (highest priority)
-    if additional_env:
-        merged_env.update(additional_env)
-
-    return merged_env
+    # .env files (lowest), then system environment, then additional vars (highest);
+    # later mappings win in a dict merge
+    return {**find_and_merge_dotenv_files(project_root), **os.environ, **(additional_env or {})}
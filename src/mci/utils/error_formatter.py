@@ -12,7 +12,7 @@ from rich.panel import Panel
 from rich.text import Text
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """Represents a validation error with message and optional location."""
 
@@ -20,7 +20,7 @@ class ValidationError:
     location: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationWarning:
     """Represents a validation warning with message and optional suggestion."""
 
@@ -0,0 +1,32 @@
+"""
+hashing.py - Stable digests of JSON-like data for cache keys
+
+This module provides a compact, order-independent digest of nested
+dicts/lists so they can be used as keys in in-process caches.
+"""
+
+import json
+from hashlib import blake2b
+from typing import Any
+
+
+def schema_digest(data: Any) -> bytes:
+    """
+    Compute a 16-byte digest identifying JSON-like data regardless of key order.
+
+    Args:
+        data: JSON-like value (typically a dict such as an inputSchema)
+
+    Returns:
+        16-byte BLAKE2b digest of the sorted JSON encoding
+
+    Raises:
+        TypeError: If the data cannot be encoded as JSON
+        ValueError: If the data contains circular references
+
+    Example:
+        >>> schema_digest({"b": 1, "a": 2}) == schema_digest({"a": 2, "b": 1})
+        True
+    """
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return blake2b(encoded, digest_size=16).digest()
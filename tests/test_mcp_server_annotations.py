@@ -0,0 +1,58 @@
+"""
+Feature test for annotation preservation in the MCP server.
+
+Loads a schema whose tools carry MCI annotations, registers them on an MCP
+server and checks that each converted tool exposes the expected annotations.
+"""
+
+import json
+from pathlib import Path
+
+import mcp.types as types
+import pytest
+import pytest_asyncio
+from mcipy import MCIClient
+
+from mci.core.mcp_server import MCPServerBuilder
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+SCHEMA_PATH = FIXTURES_DIR / "test_annotations.mci.json"
+
+# Expected annotations per tool (None for tools without annotations), shared
+# with testsManual/test_mcp_server_annotations.py
+EXPECTED_ANNOTATIONS: dict[str, dict | None] = json.loads(
+    (FIXTURES_DIR / "test_annotations.expected.json").read_text()
+)
+
+
+@pytest.fixture(scope="session")
+def mci_client() -> MCIClient:
+    """Load the annotations schema once for the whole test session."""
+    return MCIClient(schema_file_path=str(SCHEMA_PATH))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_tools(mci_client: MCIClient) -> dict[str, types.Tool]:
+    """Build the annotated MCP server once and index its tools by name."""
+    builder = MCPServerBuilder(mci_client)
+    server = await builder.create_server("annotations-test-server", "1.0.0")
+    await builder.register_all_tools(server, mci_client.tools())
+    return {tool.name: tool for tool in server._mci_tools}  # type: ignore[attr-defined]
+
+
+def test_all_tools_registered(mci_client: MCIClient, mcp_tools: dict[str, types.Tool]):
+    """Test that every tool in the schema is registered on the server."""
+    assert sorted(mcp_tools) == sorted(mci_client.list_tools())
+    assert sorted(mcp_tools) == sorted(EXPECTED_ANNOTATIONS)
+
+
+@pytest.mark.parametrize("name,expected", EXPECTED_ANNOTATIONS.items())
+def test_tool_annotations(mcp_tools: dict[str, types.Tool], name: str, expected: dict | None):
+    """Test that MCI annotations survive conversion to MCP tools."""
+    annotations = mcp_tools[name].annotations
+
+    if expected is None:
+        assert annotations is None
+    else:
+        assert annotations is not None
+        assert annotations.model_dump(exclude_none=True) == expected
@@ -0,0 +1,78 @@
+"""
+Shared fixtures for formatter tests.
+
+Tool models are validated on construction, so the common sample tools are
+built once per module. Formatters only read tools, so sharing is safe.
+"""
+
+import pytest
+from mcipy.models import Tool
+
+
+@pytest.fixture(scope="module")
+def sample_tools() -> list[Tool]:
+    """Two tagged text tools from the main schema."""
+    return [
+        Tool(
+            name="tool1",
+            description="First tool",
+            tags=["api"],
+            execution={"type": "text", "text": "hello"},
+        ),
+        Tool(
+            name="tool2",
+            description="Second tool",
+            tags=["database"],
+            execution={"type": "text", "text": "world"},
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def detailed_tool() -> Tool:
+    """Tool with tags and an input schema mixing required and optional params."""
+    return Tool(
+        name="test_tool",
+        description="A test tool",
+        tags=["api", "test"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "param1": {"type": "string", "description": "First param"},
+                "param2": {"type": "number", "description": "Second param"},
+            },
+            "required": ["param1"],
+        },
+        execution={"type": "text", "text": "Test output"},
+    )
+
+
+@pytest.fixture(scope="module")
+def simple_tool() -> Tool:
+    """Tool without tags or input schema."""
+    return Tool(
+        name="simple_tool",
+        description="Simple tool",
+        execution={"type": "text", "text": "output"},
+    )
+
+
+@pytest.fixture(scope="module")
+def sourced_tool() -> Tool:
+    """Tool loaded from a toolset."""
+    return Tool(
+        name="sourced_tool",
+        description="Tool from toolset",
+        execution={"type": "text", "text": "test"},
+        toolset_source="custom-toolset",
+    )
+
+
+@pytest.fixture(scope="module")
+def cli_tool() -> Tool:
+    """Tool with CLI execution."""
+    return Tool(
+        name="cli_tool",
+        description="CLI tool",
+        execution={"type": "cli", "command": "ls"},
+    )
@@ -11,33 +11,22 @@ from rich.table import Table
 from mci.cli.formatters.table_formatter import TableFormatter
 
 
-def test_basic_table():
-    """Test basic table format with multiple tools."""
-    tools = [
-        Tool(
-            name="tool1",
-            description="First tool",
-            tags=["api"],
-            execution={"type": "text", "text": "hello"},
-        ),
-        Tool(
-            name="tool2",
-            description="Second tool",
-            tags=["database"],
-            execution={"type": "text", "text": "world"},
-        ),
-    ]
+def render(renderable) -> str:
+    """Render a Rich object to plain text."""
+    console = Console()
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
 
-    table = TableFormatter.format_basic(tools)
+
+def test_basic_table(sample_tools: list[Tool]):
+    """Test basic table format with multiple tools."""
+    table = TableFormatter.format_basic(sample_tools)
 
     # Verify it returns a Table object
     assert isinstance(table, Table)
-    
-    # Render table to string to check contents
-    console = Console()
-    with console.capture() as capture:
-        console.print(table)
-    output = capture.get()
+
+    output = render(table)
 
     # Check that output contains expected elements
     assert "Available Tools (2)" in output
@@ -50,71 +39,37 @@ def test_basic_table():
 
 def test_basic_table_empty():
     """Test basic table with empty tools list."""
-    tools = []
-
-    table = TableFormatter.format_basic(tools)
+    table = TableFormatter.format_basic([])
 
     # Verify it returns a Table object
     assert isinstance(table, Table)
-    
-    # Render table to string to check contents
-    console = Console()
-    with console.capture() as capture:
-        console.print(table)
-    output = capture.get()
+
+    output = render(table)
 
     assert "Available Tools (0)" in output
 
 
-def test_basic_table_with_toolset_source():
+def test_basic_table_with_toolset_source(sourced_tool: Tool):
     """Test basic table shows toolset source correctly."""
-    tool = Tool(
-        name="sourced_tool",
-        description="Tool from toolset",
-        execution={"type": "text", "text": "test"},
-        toolset_source="custom-toolset",
-    )
-
-    table = TableFormatter.format_basic([tool])
+    table = TableFormatter.format_basic([sourced_tool])
 
     # Verify it returns a Table object
     assert isinstance(table, Table)
-    
-    # Render table to string to check contents
-    console = Console()
-    with console.capture() as capture:
-        console.print(table)
-    output = capture.get()
+
+    output = render(table)
 
     assert "sourced_tool" in output
     assert "custom-toolset" in output
 
 
-def test_verbose_table():
+def test_verbose_table(detailed_tool: Tool):
     """Test verbose table format with detailed information."""
-    tools = [
-        Tool(
-            name="test_tool",
-            description="A test tool",
-            tags=["api", "test"],
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "param1": {"type": "string", "description": "First param"},
-                    "param2": {"type": "number", "description": "Second param"},
-                },
-                "required": ["param1"],
-            },
-            execution={"type": "text", "text": "Test output"},
-        )
-    ]
-
-    output_lines = TableFormatter.format_verbose(tools)
+    output_lines = TableFormatter.format_verbose([detailed_tool])
 
     # Verify it returns a list of strings
     assert isinstance(output_lines, list)
     assert all(isinstance(line, str) for line in output_lines)
-    
+
     # Join lines to check contents
     output = "\n".join(output_lines)
 
@@ -128,19 +83,13 @@ def test_verbose_table():
     assert "param2 (number) (optional)" in output
 
 
-def test_verbose_table_no_parameters():
+def test_verbose_table_no_parameters(simple_tool: Tool):
     """Test verbose format for tool without parameters."""
-    tool = Tool(
-        name="simple_tool",
-        description="Simple tool",
-        execution={"type": "text", "text": "output"},
-    )
-
-    output_lines = TableFormatter.format_verbose([tool])
+    output_lines = TableFormatter.format_verbose([simple_tool])
 
     # Verify it returns a list of strings
     assert isinstance(output_lines, list)
-    
+
     # Join lines to check contents
     output = "\n".join(output_lines)
 
@@ -148,95 +97,58 @@ def test_verbose_table_no_parameters():
     assert "Parameters: none" in output
 
 
-def test_verbose_table_no_tags():
+def test_verbose_table_no_tags(simple_tool: Tool):
     """Test verbose format for tool without tags."""
-    tool = Tool(
-        name="untagged_tool",
-        description="Tool without tags",
-        execution={"type": "text", "text": "output"},
-    )
-
-    output_lines = TableFormatter.format_verbose([tool])
+    output_lines = TableFormatter.format_verbose([simple_tool])
 
     # Verify it returns a list of strings
     assert isinstance(output_lines, list)
-    
+
     # Join lines to check contents
     output = "\n".join(output_lines)
 
-    assert "untagged_tool" in output
+    assert "simple_tool" in output
     # Tags line should not appear if there are no tags
     assert "Tags:" not in output or "Tags: []" not in output
 
 
-def test_format_delegates_to_basic_or_verbose():
+def test_format_delegates_to_basic_or_verbose(detailed_tool: Tool):
     """Test that format() method delegates correctly."""
-    tool = Tool(
-        name="test",
-        description="Test",
-        tags=["test"],
-        execution={"type": "text", "text": "output"},
-    )
-
     # Test basic mode
-    basic_output = TableFormatter.format([tool], verbose=False)
+    basic_output = TableFormatter.format([detailed_tool], verbose=False)
     assert isinstance(basic_output, Table)
-    console = Console()
-    with console.capture() as capture:
-        console.print(basic_output)
-    basic_str = capture.get()
-    assert "test" in basic_str
+    basic_str = render(basic_output)
+    assert "test_tool" in basic_str
 
     # Test verbose mode
-    verbose_output = TableFormatter.format([tool], verbose=True)
+    verbose_output = TableFormatter.format([detailed_tool], verbose=True)
     assert isinstance(verbose_output, list)
     verbose_str = "\n".join(verbose_output)
-    assert "test" in verbose_str
-    assert "[test]" in verbose_str  # Tags should appear in verbose
+    assert "test_tool" in verbose_str
+    assert "[api, test]" in verbose_str  # Tags should appear in verbose
 
 
-def test_verbose_table_with_cli_execution():
+def test_verbose_table_with_cli_execution(cli_tool: Tool):
     """Test verbose format shows CLI execution type correctly."""
-    tool = Tool(
-        name="cli_tool",
-        description="CLI tool",
-        execution={"type": "cli", "command": "ls"},
-    )
-
-    output_lines = TableFormatter.format_verbose([tool])
+    output_lines = TableFormatter.format_verbose([cli_tool])
 
     # Verify it returns a list of strings
     assert isinstance(output_lines, list)
-    
+
     # Join lines to check contents
     output = "\n".join(output_lines)
 
     assert "cli_tool" in output
-    assert "cli" in output
+    assert "Execution: cli" in output
 
 
-def test_verbose_table_multiple_tools():
+def test_verbose_table_multiple_tools(sample_tools: list[Tool]):
     """Test verbose format with multiple tools."""
-    tools = [
-        Tool(
-            name="tool1",
-            description="First",
-            tags=["api"],
-            execution={"type": "text", "text": "1"},
-        ),
-        Tool(
-            name="tool2",
-            description="Second",
-            tags=["db"],
-            execution={"type": "text", "text": "2"},
-        ),
-    ]
-
-    output_lines = TableFormatter.format_verbose(tools)
+    output_lines = TableFormatter.format_verbose(sample_tools)
 
     # Verify it returns a list of strings
     assert isinstance(output_lines, list)
-    
+
     # Join lines to check contents
     output = "\n".join(output_lines)
 
@@ -244,4 +156,29 @@ def test_verbose_table_multiple_tools():
     assert "tool1" in output
     assert "tool2" in output
     assert "api" in output
-    assert "db" in output
+    assert "database" in output
+
+
+def test_plain_format():
+    """Test plain format emits tab-separated lines without Rich markup."""
+    tools = [
+        Tool(
+            name="tool_one",
+            description="First\ttool\nwith breaks",
+            execution={"type": "text", "text": "test"},
+        ),
+        Tool(
+            name="tool_two",
+            description="Second tool",
+            execution={"type": "text", "text": "test"},
+            toolset_source="weather",
+        ),
+    ]
+
+    output = TableFormatter.format_plain(tools)
+
+    assert output.splitlines() == [
+        "Name\tSource\tDescription",
+        "tool_one\tmain\tFirst tool with breaks",
+        "tool_two\tweather\tSecond tool",
+    ]
@@ -227,3 +227,37 @@ def test_yaml_with_custom_toolset_source():
     finally:
         if os.path.exists(filename):
             os.remove(filename)
+
+
+def test_yaml_round_trips_special_strings():
+    """Test YAML output preserves quotes, newlines, unicode and YAML keywords."""
+    description = 'Says "hi": yes\nsecond line 🧩   # not a comment'
+    tool = Tool(
+        name="null",
+        description=description,
+        tags=["yes", "a: b"],
+        inputSchema={
+            "type": "object",
+            "properties": {"msg": {"type": "string", "description": "multi\nline"}},
+        },
+        execution={"type": "text", "text": "test"},
+    )
+
+    filename = YAMLFormatter.format_to_file(
+        tools=[tool], mci_file="test.mci.json", filters_applied=["tags:api"], verbose=True
+    )
+
+    try:
+        with open(filename, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+        tool_data = data["tools"][0]
+        assert tool_data["name"] == "null"
+        assert tool_data["description"] == description
+        assert tool_data["tags"] == ["yes", "a: b"]
+        assert tool_data["inputSchema"] == tool.inputSchema
+        assert data["filters_applied"] == ["tags:api"]
+
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
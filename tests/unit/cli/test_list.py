@@ -8,6 +8,7 @@ import json
 import tempfile
 from pathlib import Path
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
@@ -389,3 +390,48 @@ def test_list_json_verbose():
 
     finally:
         Path(schema_path).unlink()
+
+
+def test_list_plain():
+    """Test list command with plain tab-separated output."""
+    schema = {
+        "schemaVersion": "1.0",
+        "tools": [
+            {
+                "name": "tool1",
+                "description": "First",
+                "execution": {"type": "text", "text": "1"},
+            },
+        ],
+    }
+
+    schema_path = create_test_schema(schema)
+    runner = CliRunner()
+
+    try:
+        result = runner.invoke(list_command, ["--file", schema_path, "--plain"])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["Name\tSource\tDescription", "tool1\tmain\tFirst"]
+        assert "Available Tools" not in result.output
+
+    finally:
+        Path(schema_path).unlink()
+
+
+@pytest.mark.parametrize("extra_args", [["--verbose"], ["--format", "json"], ["--format", "yaml"]])
+def test_list_plain_rejects_unsupported_combinations(extra_args):
+    """Test that --plain with --verbose or a file format is a usage error."""
+    schema = {"schemaVersion": "1.0", "tools": []}
+
+    schema_path = create_test_schema(schema)
+    runner = CliRunner()
+
+    try:
+        result = runner.invoke(list_command, ["--file", schema_path, "--plain", *extra_args])
+
+        assert result.exit_code == 2
+        assert "--plain cannot be combined" in result.output
+
+    finally:
+        Path(schema_path).unlink()
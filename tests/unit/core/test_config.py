@@ -10,48 +10,57 @@ from pathlib import Path
 import pytest
 from mcipy import MCIClientError
 
+from mci.core import config as config_module
 from mci.core.config import MCIConfig
 
+VALID_SCHEMA_JSON = """{
+    "schemaVersion": "1.0",
+    "metadata": {
+        "name": "Test Project",
+        "description": "Test MCI configuration"
+    },
+    "tools": [],
+    "toolsets": []
+}"""
 
-def test_load_valid_schema_with_mciclient():
-    """Test loading a valid schema using MCIClient."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a valid MCI schema file
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+INVALID_SCHEMA_JSON = """{
+    "invalid": "schema"
+}"""
 
-        config = MCIConfig()
-        client = config.load(str(schema_file))
 
-        # Should successfully load without errors
-        assert client is not None
-        # Should be able to get tools (even if empty)
-        tools = client.tools()
-        assert isinstance(tools, list)
+@pytest.fixture
+def valid_schema_file(tmp_path: Path) -> Path:
+    """Write the valid test schema to a temporary mci.json."""
+    schema_file = tmp_path / "mci.json"
+    schema_file.write_text(VALID_SCHEMA_JSON)
+    return schema_file
 
 
-def test_invalid_schema_caught_by_mciclient():
-    """Test that MCIClient catches invalid schema."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create an invalid schema (missing required fields)
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "invalid": "schema"
-        }"""
-        schema_file.write_text(schema_content)
+@pytest.fixture
+def invalid_schema_file(tmp_path: Path) -> Path:
+    """Write the invalid test schema to a temporary mci.json."""
+    schema_file = tmp_path / "mci.json"
+    schema_file.write_text(INVALID_SCHEMA_JSON)
+    return schema_file
 
-        config = MCIConfig()
-        with pytest.raises(MCIClientError):
-            config.load(str(schema_file))
+
+def test_load_valid_schema_with_mciclient(valid_schema_file: Path):
+    """Test loading a valid schema using MCIClient."""
+    config = MCIConfig()
+    client = config.load(str(valid_schema_file))
+
+    # Should successfully load without errors
+    assert client is not None
+    # Should be able to get tools (even if empty)
+    tools = client.tools()
+    assert isinstance(tools, list)
+
+
+def test_invalid_schema_caught_by_mciclient(invalid_schema_file: Path):
+    """Test that MCIClient catches invalid schema."""
+    config = MCIConfig()
+    with pytest.raises(MCIClientError):
+        config.load(str(invalid_schema_file))
 
 
 def test_missing_file_error():
@@ -61,45 +70,43 @@ def test_missing_file_error():
         config.load("/nonexistent/path/to/mci.json")
 
 
-def test_validate_schema_valid():
+def test_validate_schema_valid(valid_schema_file: Path):
     """Test validating a valid schema returns (True, '')."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a valid MCI schema file
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
-
-        config = MCIConfig()
-        is_valid, error = config.validate_schema(str(schema_file))
+    config = MCIConfig()
+    is_valid, error = config.validate_schema(str(valid_schema_file))
 
-        assert is_valid is True
-        assert error == ""
+    assert is_valid is True
+    assert error == ""
 
 
-def test_validate_schema_invalid():
+def test_validate_schema_invalid(invalid_schema_file: Path):
     """Test validating an invalid schema returns (False, error_message)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create an invalid schema
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "invalid": "schema"
-        }"""
-        schema_file.write_text(schema_content)
+    config = MCIConfig()
+    is_valid, error = config.validate_schema(str(invalid_schema_file))
 
-        config = MCIConfig()
-        is_valid, error = config.validate_schema(str(schema_file))
+    assert is_valid is False
+    assert error != ""
+    assert len(error) > 0
+
+
+def test_validate_schema_with_client_valid(valid_schema_file: Path):
+    """Test that validating a valid schema also returns the validation client."""
+    config = MCIConfig()
+    is_valid, error, client = config.validate_schema_with_client(str(valid_schema_file))
 
-        assert is_valid is False
-        assert error != ""
-        assert len(error) > 0
+    assert (is_valid, error) == (True, "")
+    assert client is not None
+    assert client.list_tools() == []
+
+
+def test_validate_schema_with_client_invalid(invalid_schema_file: Path):
+    """Test that no client is returned for an invalid schema."""
+    config = MCIConfig()
+    is_valid, error, client = config.validate_schema_with_client(str(invalid_schema_file))
+
+    assert is_valid is False
+    assert error != ""
+    assert client is None
 
 
 def test_validate_schema_missing_file():
@@ -112,71 +119,35 @@ def test_validate_schema_missing_file():
     assert "not found" in error.lower() or "error" in error.lower()
 
 
-def test_error_message_extraction():
+def test_error_message_extraction(invalid_schema_file: Path):
     """Test that error messages from MCIClient are properly extracted."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create an invalid schema
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "invalid": "schema"
-        }"""
-        schema_file.write_text(schema_content)
-
-        config = MCIConfig()
-        is_valid, error = config.validate_schema(str(schema_file))
+    config = MCIConfig()
+    is_valid, error = config.validate_schema(str(invalid_schema_file))
 
-        # Error message should be extracted and non-empty
-        assert is_valid is False
-        assert isinstance(error, str)
-        assert len(error) > 0
+    # Error message should be extracted and non-empty
+    assert is_valid is False
+    assert isinstance(error, str)
+    assert len(error) > 0
 
 
-def test_load_with_env_vars():
+def test_load_with_env_vars(valid_schema_file: Path):
     """Test loading schema with environment variables."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a schema with environment variable templates
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
-
-        config = MCIConfig()
-        env_vars = {"TEST_VAR": "test_value"}
-        client = config.load(str(schema_file), env_vars)
+    config = MCIConfig()
+    env_vars = {"TEST_VAR": "test_value"}
+    client = config.load(str(valid_schema_file), env_vars)
 
-        # Should successfully load with env vars
-        assert client is not None
+    # Should successfully load with env vars
+    assert client is not None
 
 
-def test_validate_schema_with_env_vars():
+def test_validate_schema_with_env_vars(valid_schema_file: Path):
     """Test validating schema with environment variables."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a valid schema
-        schema_file = Path(tmpdir) / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
-
-        config = MCIConfig()
-        env_vars = {"TEST_VAR": "test_value"}
-        is_valid, error = config.validate_schema(str(schema_file), env_vars)
+    config = MCIConfig()
+    env_vars = {"TEST_VAR": "test_value"}
+    is_valid, error = config.validate_schema(str(valid_schema_file), env_vars)
 
-        assert is_valid is True
-        assert error == ""
+    assert is_valid is True
+    assert error == ""
 
 
 def test_load_yaml_file():
@@ -230,16 +201,7 @@ def test_load_with_dotenv_from_root():
 
         # Create a valid schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         # Load without explicit env_vars - should auto-load from .env
@@ -262,16 +224,7 @@ def test_load_with_dotenv_from_mci_dir():
 
         # Create schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         client = config.load(str(schema_file))
@@ -296,16 +249,7 @@ def test_load_with_dotenv_precedence():
 
         # Create schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         client = config.load(str(schema_file))
@@ -325,16 +269,7 @@ def test_load_dotenv_disabled():
 
         # Create schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         # Disable auto-loading
@@ -354,16 +289,7 @@ def test_load_with_dotenv_and_explicit_env_vars():
 
         # Create schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         # Explicit env_vars should take precedence
@@ -384,19 +310,103 @@ def test_validate_schema_with_dotenv():
 
         # Create schema file
         schema_file = tmpdir_path / "mci.json"
-        schema_content = """{
-            "schemaVersion": "1.0",
-            "metadata": {
-                "name": "Test Project",
-                "description": "Test MCI configuration"
-            },
-            "tools": [],
-            "toolsets": []
-        }"""
-        schema_file.write_text(schema_content)
+        schema_file.write_text(VALID_SCHEMA_JSON)
 
         config = MCIConfig()
         is_valid, error = config.validate_schema(str(schema_file))
 
         assert is_valid is True
         assert error == ""
+
+
+def test_load_reuses_client_for_unchanged_file():
+    """Test that loading the same unchanged file twice returns the cached client."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        schema_file = Path(tmpdir) / "mci.json"
+        schema_file.write_text('{"schemaVersion": "1.0", "tools": []}')
+
+        config = MCIConfig()
+        first = config.load(str(schema_file))
+        second = config.load(str(schema_file))
+        other_env = config.load(str(schema_file), env_vars={"CACHE_TEST_VAR": "1"})
+
+        assert first is second
+        assert other_env is not first
+
+
+def test_load_rebuilds_client_after_file_change():
+    """Test that a modified schema file is parsed again instead of served from cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        schema_file = Path(tmpdir) / "mci.json"
+        schema_file.write_text('{"schemaVersion": "1.0", "tools": []}')
+
+        config = MCIConfig()
+        first = config.load(str(schema_file))
+        assert first.list_tools() == []
+
+        schema_file.write_text(
+            '{"schemaVersion": "1.0", "tools": [{"name": "added", '
+            '"execution": {"type": "text", "text": "hi"}}]}'
+        )
+        second = config.load(str(schema_file))
+
+        assert second is not first
+        assert second.list_tools() == ["added"]
+
+
+def test_load_picks_up_toolset_file_changes(tmp_path: Path):
+    """Test that editing a toolset file is reflected even though mci.json is unchanged."""
+    mci_dir = tmp_path / "mci"
+    mci_dir.mkdir()
+    toolset_file = mci_dir / "ts.mci.json"
+    toolset_file.write_text(
+        '{"schemaVersion": "1.0", "tools": [{"name": "before", '
+        '"execution": {"type": "text", "text": "hi"}}]}'
+    )
+    schema_file = tmp_path / "mci.json"
+    schema_file.write_text('{"schemaVersion": "1.0", "tools": [], "toolsets": ["ts"]}')
+
+    config = MCIConfig()
+    first = config.load(str(schema_file))
+    assert first.list_tools() == ["before"]
+
+    toolset_file.write_text(
+        '{"schemaVersion": "1.0", "tools": [{"name": "after", '
+        '"execution": {"type": "text", "text": "hi"}}]}'
+    )
+    second = config.load(str(schema_file))
+
+    assert second is not first
+    assert second.list_tools() == ["after"]
+
+
+def test_validate_schema_detects_deleted_toolset_after_load(tmp_path: Path):
+    """Test that a toolset deleted after a successful load fails validation."""
+    mci_dir = tmp_path / "mci"
+    mci_dir.mkdir()
+    toolset_file = mci_dir / "ts.mci.json"
+    toolset_file.write_text('{"schemaVersion": "1.0", "tools": []}')
+    schema_file = tmp_path / "mci.json"
+    schema_file.write_text('{"schemaVersion": "1.0", "tools": [], "toolsets": ["ts"]}')
+
+    config = MCIConfig()
+    config.load(str(schema_file))
+    assert config.validate_schema(str(schema_file)) == (True, "")
+
+    toolset_file.unlink()
+    is_valid, error = config.validate_schema(str(schema_file))
+
+    assert is_valid is False
+    assert error != ""
+
+
+def test_client_cache_is_bounded(tmp_path: Path):
+    """Test that the client cache evicts old entries once it is full."""
+    schema_file = tmp_path / "mci.json"
+    schema_file.write_text('{"schemaVersion": "1.0", "tools": []}')
+
+    config = MCIConfig()
+    for index in range(config_module._CLIENT_CACHE_MAX_SIZE + 5):
+        config.load(str(schema_file), env_vars={"CACHE_BOUND_VAR": str(index)})
+
+    assert len(config_module._CLIENT_CACHE) <= config_module._CLIENT_CACHE_MAX_SIZE
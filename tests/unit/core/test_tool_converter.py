@@ -5,9 +5,13 @@ Tests the conversion of MCI tool definitions to MCP tool format,
 ensuring proper schema conversion and metadata preservation.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import mcp.types as types
 from mcipy.models import Annotations, Tool
 
+from mci.core import tool_converter as tool_converter_module
 from mci.core.tool_converter import MCIToolConverter
 
 
@@ -21,8 +25,7 @@ def test_convert_mci_to_mcp_tool():
         inputSchema={"type": "object", "properties": {"name": {"type": "string"}}},
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     # Verify the conversion
     assert isinstance(mcp_tool, types.Tool)
@@ -38,8 +41,7 @@ def test_convert_tool_without_description():
         name="no_desc_tool", execution={"type": "text", "text": "Test"}, description=None
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     assert mcp_tool.name == "no_desc_tool"
     assert mcp_tool.description == ""  # Should default to empty string
@@ -54,8 +56,7 @@ def test_convert_tool_without_input_schema():
         inputSchema=None,
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     assert mcp_tool.name == "no_schema_tool"
     # Should have a minimal valid schema
@@ -71,8 +72,7 @@ def test_convert_input_schema():
         "required": ["city"],
     }
 
-    converter = MCIToolConverter()
-    mcp_schema = converter.convert_input_schema(schema)
+    mcp_schema = MCIToolConverter.convert_input_schema(schema)
 
     assert mcp_schema["type"] == "object"
     assert "properties" in mcp_schema
@@ -82,20 +82,28 @@ def test_convert_input_schema():
 
 def test_convert_empty_input_schema():
     """Test converting an empty inputSchema."""
-    converter = MCIToolConverter()
-    mcp_schema = converter.convert_input_schema({})
+    mcp_schema = MCIToolConverter.convert_input_schema({})
 
     # Should provide minimal valid schema
     assert mcp_schema["type"] == "object"
     assert "properties" in mcp_schema
 
 
+def test_convert_empty_input_schema_returns_fresh_dict():
+    """Test that mutating one empty-schema result does not leak into the next."""
+    first = MCIToolConverter.convert_input_schema({})
+    first["properties"]["leak"] = {"type": "string"}
+
+    second = MCIToolConverter.convert_input_schema({})
+
+    assert second == {"type": "object", "properties": {}}
+
+
 def test_convert_schema_without_type():
     """Test converting a schema that's missing the type field."""
     schema = {"properties": {"name": {"type": "string"}}}
 
-    converter = MCIToolConverter()
-    mcp_schema = converter.convert_input_schema(schema)
+    mcp_schema = MCIToolConverter.convert_input_schema(schema)
 
     # Should add type field
     assert mcp_schema["type"] == "object"
@@ -111,8 +119,7 @@ def test_preserve_tool_description():
         execution={"type": "text", "text": "Output"},
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     assert mcp_tool.description == description
 
@@ -136,8 +143,7 @@ def test_convert_complex_input_schema():
         "required": ["user"],
     }
 
-    converter = MCIToolConverter()
-    mcp_schema = converter.convert_input_schema(schema)
+    mcp_schema = MCIToolConverter.convert_input_schema(schema)
 
     assert mcp_schema["type"] == "object"
     assert "user" in mcp_schema["properties"]
@@ -190,8 +196,7 @@ def test_convert_tool_with_annotations():
         ),
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     # Verify annotations are transferred
     assert mcp_tool.annotations is not None
@@ -212,8 +217,7 @@ def test_convert_tool_with_partial_annotations():
         annotations=Annotations(title="My Tool", destructiveHint=True),
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     # Verify annotations are transferred with None for unset fields
     assert mcp_tool.annotations is not None
@@ -233,8 +237,7 @@ def test_convert_tool_without_annotations():
         annotations=None,
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     # Should have None for annotations
     assert mcp_tool.annotations is None
@@ -296,8 +299,7 @@ def test_annotations_preserved_in_mcp_tool_object():
         ),
     )
 
-    converter = MCIToolConverter()
-    mcp_tool = converter.convert_to_mcp_tool(mci_tool)
+    mcp_tool = MCIToolConverter.convert_to_mcp_tool(mci_tool)
 
     # Verify all properties match the example from the issue
     assert mcp_tool.name == "delete_resource"
@@ -308,3 +310,49 @@ def test_annotations_preserved_in_mcp_tool_object():
     assert mcp_tool.annotations.destructiveHint is True
     assert mcp_tool.annotations.idempotentHint is False
     assert mcp_tool.annotations.openWorldHint is True
+
+
+def test_convert_identical_tool_reuses_cached_result():
+    """Test that converting an identical tool again returns the cached MCP tool."""
+    schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+    tool_a = Tool(name="cached_tool", inputSchema=schema, execution={"type": "text", "text": "a"})
+    tool_b = Tool(
+        name="cached_tool", inputSchema=dict(schema), execution={"type": "text", "text": "b"}
+    )
+
+    assert MCIToolConverter.convert_to_mcp_tool(tool_a) is MCIToolConverter.convert_to_mcp_tool(
+        tool_b
+    )
+
+
+def test_convert_tool_cache_distinguishes_annotations():
+    """Test that tools differing only in annotations are converted separately."""
+    plain = Tool(name="annotated_cache_tool", execution={"type": "text", "text": "x"})
+    annotated = Tool(
+        name="annotated_cache_tool",
+        execution={"type": "text", "text": "x"},
+        annotations=Annotations(readOnlyHint=True),
+    )
+
+    plain_mcp = MCIToolConverter.convert_to_mcp_tool(plain)
+    annotated_mcp = MCIToolConverter.convert_to_mcp_tool(annotated)
+
+    assert plain_mcp.annotations is None
+    assert annotated_mcp.annotations is not None
+    assert annotated_mcp.annotations.readOnlyHint is True
+
+
+def test_convert_tool_cache_is_bounded_under_concurrent_use(monkeypatch):
+    """Test that concurrent conversions evict safely and keep the cache bounded."""
+    monkeypatch.setattr(tool_converter_module, "_MCP_TOOL_CACHE", OrderedDict())
+    monkeypatch.setattr(tool_converter_module, "_MCP_TOOL_CACHE_MAX_SIZE", 8)
+    tools = [
+        Tool(name=f"concurrent_tool_{index}", execution={"type": "text", "text": "x"})
+        for index in range(200)
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        converted = list(executor.map(MCIToolConverter.convert_to_mcp_tool, tools))
+
+    assert [tool.name for tool in converted] == [tool.name for tool in tools]
+    assert len(tool_converter_module._MCP_TOOL_CACHE) <= 8
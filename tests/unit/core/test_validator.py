@@ -7,6 +7,7 @@ Tests the schema validation using MCIClient and additional checks.
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from mci.core.validator import MCIValidator
 
@@ -205,3 +206,42 @@ def test_check_toolset_files_with_existing_file():
         # Check that there's no warning about toolset
         toolset_warnings = [w for w in result.warnings if "toolset" in w.message.lower()]
         assert len(toolset_warnings) == 0
+
+
+def test_schema_data_reused_from_client():
+    """Test that schema data comes from the MCIClient parse, not a second file read."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        schema_file = Path(tmpdir) / "mci.json"
+        schema_content = {
+            "schemaVersion": "1.0",
+            "tools": [],
+            "mcp_servers": {"server1": {"command": "fake_command_1"}},
+        }
+        schema_file.write_text(json.dumps(schema_content))
+
+        validator = MCIValidator(str(schema_file))
+        with patch.object(Path, "read_bytes") as mock_read_bytes:
+            result = validator.validate_schema()
+
+        mock_read_bytes.assert_not_called()
+        assert result.is_valid is True
+        assert validator.schema_data is not None
+        assert validator.schema_data["mcp_servers"]["server1"]["command"] == "fake_command_1"
+
+
+def test_mcp_command_lookup_follows_path_changes(monkeypatch, tmp_path):
+    """Test that cached command lookups are not reused after PATH changes."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    command = bin_dir / "my_fake_mcp_server"
+    command.write_text("#!/bin/sh\n")
+    command.chmod(0o755)
+
+    validator = MCIValidator(str(tmp_path / "mci.json"))
+    validator.schema_data = {"mcp_servers": {"server": {"command": "my_fake_mcp_server"}}}
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert len(validator.check_mcp_commands()) == 1
+
+    monkeypatch.setenv("PATH", str(bin_dir))
+    assert validator.check_mcp_commands() == []
@@ -4,9 +4,15 @@ Unit tests for dotenv parsing utilities.
 Tests the .env file parsing, discovery, and merging functionality.
 """
 
-import tempfile
+import os
+from collections.abc import Callable
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+from dotenv import dotenv_values
+
+from mci.utils import dotenv as dotenv_module
 from mci.utils.dotenv import (
     find_and_merge_dotenv_files,
     get_env_with_dotenv,
@@ -14,449 +20,412 @@ from mci.utils.dotenv import (
 )
 
 
-def test_parse_dotenv_file_basic():
+@pytest.fixture
+def make_env_tree(tmp_path: Path) -> Callable[[dict[str, str]], Path]:
+    """Return a factory that writes {relative path: content} files under tmp_path."""
+
+    def _make(files: dict[str, str]) -> Path:
+        for relative_path, content in files.items():
+            file_path = tmp_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+        return tmp_path
+
+    return _make
+
+
+def test_parse_dotenv_file_basic(tmp_path):
     """Test parsing a basic .env file with KEY=VALUE format."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_file.write_text("API_KEY=test-key-123\nBASE_URL=https://api.example.com\n")
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=test-key-123\nBASE_URL=https://api.example.com\n")
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+    }
 
 
-def test_parse_dotenv_file_with_comments():
+def test_parse_dotenv_file_with_comments(tmp_path):
     """Test parsing .env file with comments."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """# This is a comment
+    env_file = tmp_path / ".env"
+    env_content = """# This is a comment
 API_KEY=test-key-123
 # Another comment
 BASE_URL=https://api.example.com
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+    }
 
 
-def test_parse_dotenv_file_with_blank_lines():
+def test_parse_dotenv_file_with_blank_lines(tmp_path):
     """Test parsing .env file with blank lines."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """API_KEY=test-key-123
+    env_file = tmp_path / ".env"
+    env_content = """API_KEY=test-key-123
 
 BASE_URL=https://api.example.com
 
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+    }
 
 
-def test_parse_dotenv_file_with_export():
+def test_parse_dotenv_file_with_export(tmp_path):
     """Test parsing .env file with export keyword."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """export API_KEY=test-key-123
+    env_file = tmp_path / ".env"
+    env_content = """export API_KEY=test-key-123
 export BASE_URL=https://api.example.com
 NORMAL_VAR=value
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-            "NORMAL_VAR": "value",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+        "NORMAL_VAR": "value",
+    }
 
 
-def test_parse_dotenv_file_with_quotes():
+def test_parse_dotenv_file_with_quotes(tmp_path):
     """Test parsing .env file with quoted values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """API_KEY="test-key-123"
+    env_file = tmp_path / ".env"
+    env_content = """API_KEY="test-key-123"
 BASE_URL='https://api.example.com'
 MESSAGE="Hello World"
 SINGLE='Single quotes'
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-            "MESSAGE": "Hello World",
-            "SINGLE": "Single quotes",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+        "MESSAGE": "Hello World",
+        "SINGLE": "Single quotes",
+    }
 
 
-def test_parse_dotenv_file_with_spaces():
+def test_parse_dotenv_file_with_spaces(tmp_path):
     """Test parsing .env file with spaces around equals sign."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """API_KEY = test-key-123
+    env_file = tmp_path / ".env"
+    env_content = """API_KEY = test-key-123
 BASE_URL=https://api.example.com
 SPACED = value with spaces
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-            "SPACED": "value with spaces",
-        }
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+        "SPACED": "value with spaces",
+    }
 
 
-def test_parse_dotenv_file_empty():
+def test_parse_dotenv_file_empty(tmp_path):
     """Test parsing empty .env file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_file.write_text("")
+    env_file = tmp_path / ".env"
+    env_file.write_text("")
 
+    with patch("mci.utils.dotenv.dotenv_values") as mock_values:
         env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {}
+    assert env_vars == {}
+    mock_values.assert_not_called()
 
 
-def test_parse_dotenv_file_nonexistent():
+def test_parse_dotenv_file_nonexistent(tmp_path):
     """Test parsing nonexistent .env file returns empty dict."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / "nonexistent.env"
+    env_file = tmp_path / "nonexistent.env"
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        assert env_vars == {}
+    assert env_vars == {}
 
 
-def test_parse_dotenv_file_with_malformed_lines():
+def test_parse_dotenv_file_with_malformed_lines(tmp_path):
     """Test parsing .env file with malformed lines (should skip them)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_file = Path(tmpdir) / ".env"
-        env_content = """API_KEY=test-key-123
+    env_file = tmp_path / ".env"
+    env_content = """API_KEY=test-key-123
 INVALID LINE WITHOUT EQUALS
 =VALUE_WITHOUT_KEY
 BASE_URL=https://api.example.com
 """
-        env_file.write_text(env_content)
+    env_file.write_text(env_content)
 
-        env_vars = parse_dotenv_file(env_file)
+    env_vars = parse_dotenv_file(env_file)
 
-        # Should only parse valid lines
-        assert env_vars == {
-            "API_KEY": "test-key-123",
-            "BASE_URL": "https://api.example.com",
-        }
+    # Should only parse valid lines
+    assert env_vars == {
+        "API_KEY": "test-key-123",
+        "BASE_URL": "https://api.example.com",
+    }
 
 
-def test_find_and_merge_dotenv_files_both_exist():
-    """Test merging .env files when both root and mci/.env exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+def test_parse_dotenv_file_reuses_cached_result(tmp_path):
+    """Test that an unchanged .env file is parsed only once."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=test-key-123\n")
 
-        # Create mci directory
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
+    with patch("mci.utils.dotenv.dotenv_values", wraps=dotenv_values) as mock_values:
+        first = parse_dotenv_file(env_file)
+        first["API_KEY"] = "mutated"
+        second = parse_dotenv_file(env_file)
 
-        # Create ./mci/.env
-        mci_env = mci_dir / ".env"
-        mci_env.write_text("API_KEY=mci-key\nMCI_VAR=mci-value\n")
+    assert mock_values.call_count == 1
+    assert second == {"API_KEY": "test-key-123"}
 
-        # Create root .env (should override API_KEY)
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("API_KEY=root-key\nROOT_VAR=root-value\n")
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
-
-        # Root .env should override ./mci/.env for API_KEY
-        assert env_vars == {
-            "API_KEY": "root-key",  # Overridden by root
-            "MCI_VAR": "mci-value",  # From mci/.env
-            "ROOT_VAR": "root-value",  # From root .env
-        }
+def test_parse_dotenv_file_reparses_changed_file(tmp_path):
+    """Test that editing a .env file invalidates the cached result."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=old\n")
+    assert parse_dotenv_file(env_file) == {"API_KEY": "old"}
 
+    env_file.write_text("API_KEY=new\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
 
-def test_find_and_merge_dotenv_files_only_root():
-    """Test loading .env when only root .env exists."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    assert parse_dotenv_file(env_file) == {"API_KEY": "new"}
 
-        # Create root .env only
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("API_KEY=root-key\nROOT_VAR=root-value\n")
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
+def test_parse_dotenv_file_interpolates_current_environment(tmp_path, monkeypatch):
+    """Test that ${VAR} references follow os.environ changes between parses."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("URL=${DOTENV_TEST_HOST}/api\n")
 
-        assert env_vars == {
-            "API_KEY": "root-key",
-            "ROOT_VAR": "root-value",
-        }
+    monkeypatch.setenv("DOTENV_TEST_HOST", "a.example")
+    assert parse_dotenv_file(env_file) == {"URL": "a.example/api"}
 
+    monkeypatch.setenv("DOTENV_TEST_HOST", "b.example")
+    assert parse_dotenv_file(env_file) == {"URL": "b.example/api"}
 
-def test_find_and_merge_dotenv_files_only_mci():
-    """Test loading .env when only mci/.env exists."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
 
-        # Create mci directory
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
+def test_parse_dotenv_file_cache_is_bounded(tmp_path):
+    """Test that the parse cache evicts old entries instead of growing forever."""
+    for index in range(dotenv_module._PARSE_CACHE_MAX_SIZE + 5):
+        env_file = tmp_path / f"{index}.env"
+        env_file.write_text(f"INDEX={index}\n")
+        assert parse_dotenv_file(env_file) == {"INDEX": str(index)}
 
-        # Create ./mci/.env only
-        mci_env = mci_dir / ".env"
-        mci_env.write_text("API_KEY=mci-key\nMCI_VAR=mci-value\n")
+    assert len(dotenv_module._PARSE_CACHE) <= dotenv_module._PARSE_CACHE_MAX_SIZE
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
 
-        assert env_vars == {
-            "API_KEY": "mci-key",
-            "MCI_VAR": "mci-value",
-        }
+def test_parse_dotenv_file_cache_omits_interpolated_values(tmp_path):
+    """Test that values depending on os.environ are never stored in the parse cache."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("URL=${HOME}/api\n")
+    parse_dotenv_file(env_file)
 
+    cached = dotenv_module._PARSE_CACHE[os.path.abspath(env_file)]
 
-def test_find_and_merge_dotenv_files_neither_exist():
-    """Test loading .env when neither root nor mci/.env exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    assert cached[2] is None
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
 
-        assert env_vars == {}
+def test_find_and_merge_dotenv_files_both_exist(make_env_tree):
+    """Test merging .env files when both root and mci/.env exist."""
+    root = make_env_tree(
+        {
+            "mci/.env": "API_KEY=mci-key\nMCI_VAR=mci-value\n",
+            # Root .env should override API_KEY
+            ".env": "API_KEY=root-key\nROOT_VAR=root-value\n",
+        }
+    )
 
+    env_vars = find_and_merge_dotenv_files(root)
 
-def test_find_and_merge_dotenv_files_default_cwd():
-    """Test finding .env files using current directory by default."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    # Root .env should override ./mci/.env for API_KEY
+    assert env_vars == {
+        "API_KEY": "root-key",  # Overridden by root
+        "MCI_VAR": "mci-value",  # From mci/.env
+        "ROOT_VAR": "root-value",  # From root .env
+    }
 
-        # Create root .env
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("CWD_VAR=cwd-value\n")
 
-        # Change to temp directory and test
-        import os
+def test_find_and_merge_dotenv_files_only_root(make_env_tree):
+    """Test loading .env when only root .env exists."""
+    root = make_env_tree({".env": "API_KEY=root-key\nROOT_VAR=root-value\n"})
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmpdir_path)
-            env_vars = find_and_merge_dotenv_files()
-            assert "CWD_VAR" in env_vars
-            assert env_vars["CWD_VAR"] == "cwd-value"
-        finally:
-            os.chdir(original_cwd)
+    env_vars = find_and_merge_dotenv_files(root)
 
+    assert env_vars == {
+        "API_KEY": "root-key",
+        "ROOT_VAR": "root-value",
+    }
 
-def test_get_env_with_dotenv_basic():
-    """Test getting environment with .env files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
 
-        # Create root .env
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("DOTENV_VAR=dotenv-value\n")
+def test_find_and_merge_dotenv_files_only_mci(make_env_tree):
+    """Test loading .env when only mci/.env exists."""
+    root = make_env_tree({"mci/.env": "API_KEY=mci-key\nMCI_VAR=mci-value\n"})
 
-        env_vars = get_env_with_dotenv(tmpdir_path)
+    env_vars = find_and_merge_dotenv_files(root)
 
-        # Should include .env variable
-        assert "DOTENV_VAR" in env_vars
-        assert env_vars["DOTENV_VAR"] == "dotenv-value"
+    assert env_vars == {
+        "API_KEY": "mci-key",
+        "MCI_VAR": "mci-value",
+    }
 
-        # Should also include system environment variables
-        assert "PATH" in env_vars  # System var
 
+def test_find_and_merge_dotenv_files_neither_exist(make_env_tree):
+    """Test loading .env when neither root nor mci/.env exist."""
+    root = make_env_tree({})
 
-def test_get_env_with_dotenv_precedence():
-    """Test precedence order: .env < system < additional."""
-    import os
+    env_vars = find_and_merge_dotenv_files(root)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    assert env_vars == {}
 
-        # Create mci/.env
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
-        mci_env = mci_dir / ".env"
-        mci_env.write_text("TEST_VAR=mci-value\nMCI_ONLY=mci\n")
 
-        # Create root .env
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("TEST_VAR=root-value\nROOT_ONLY=root\n")
+def test_find_and_merge_dotenv_files_default_cwd(monkeypatch, make_env_tree):
+    """Test finding .env files using current directory by default."""
+    root = make_env_tree({".env": "CWD_VAR=cwd-value\n"})
 
-        # Set system environment variable
-        original_value = os.environ.get("TEST_VAR")
-        try:
-            os.environ["TEST_VAR"] = "system-value"
+    monkeypatch.chdir(root)
+    env_vars = find_and_merge_dotenv_files()
 
-            # Get with additional override
-            env_vars = get_env_with_dotenv(
-                tmpdir_path, additional_env={"TEST_VAR": "additional-value"}
-            )
+    assert "CWD_VAR" in env_vars
+    assert env_vars["CWD_VAR"] == "cwd-value"
 
-            # Precedence: additional > system > root > mci
-            assert env_vars["TEST_VAR"] == "additional-value"
-            assert env_vars["MCI_ONLY"] == "mci"
-            assert env_vars["ROOT_ONLY"] == "root"
 
-        finally:
-            # Restore original value
-            if original_value is not None:
-                os.environ["TEST_VAR"] = original_value
-            else:
-                os.environ.pop("TEST_VAR", None)
+def test_get_env_with_dotenv_basic(make_env_tree):
+    """Test getting environment with .env files."""
+    root = make_env_tree({".env": "DOTENV_VAR=dotenv-value\n"})
 
+    env_vars = get_env_with_dotenv(root)
 
-def test_get_env_with_dotenv_no_additional():
-    """Test getting environment without additional vars."""
-    import os
+    # Should include .env variable
+    assert "DOTENV_VAR" in env_vars
+    assert env_vars["DOTENV_VAR"] == "dotenv-value"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    # Should also include system environment variables
+    assert "PATH" in env_vars  # System var
 
-        # Create root .env
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("DOTENV_VAR=dotenv-value\n")
 
-        # Set system environment variable
-        original_value = os.environ.get("SYSTEM_VAR")
-        try:
-            os.environ["SYSTEM_VAR"] = "system-value"
+def test_get_env_with_dotenv_precedence(monkeypatch, make_env_tree):
+    """Test precedence order: .env < system < additional."""
+    root = make_env_tree(
+        {
+            "mci/.env": "TEST_VAR=mci-value\nMCI_ONLY=mci\n",
+            ".env": "TEST_VAR=root-value\nROOT_ONLY=root\n",
+        }
+    )
 
-            env_vars = get_env_with_dotenv(tmpdir_path)
+    # Set system environment variable
+    monkeypatch.setenv("TEST_VAR", "system-value")
 
-            # Should have both .env and system vars
-            assert env_vars["DOTENV_VAR"] == "dotenv-value"
-            assert env_vars["SYSTEM_VAR"] == "system-value"
+    # Get with additional override
+    env_vars = get_env_with_dotenv(root, additional_env={"TEST_VAR": "additional-value"})
 
-        finally:
-            if original_value is not None:
-                os.environ["SYSTEM_VAR"] = original_value
-            else:
-                os.environ.pop("SYSTEM_VAR", None)
+    # Precedence: additional > system > root > mci
+    assert env_vars["TEST_VAR"] == "additional-value"
+    assert env_vars["MCI_ONLY"] == "mci"
+    assert env_vars["ROOT_ONLY"] == "root"
 
 
-def test_env_mci_priority_over_env():
-    """Test that when .env.mci files exist, .env files are not loaded."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+def test_get_env_with_dotenv_no_additional(monkeypatch, make_env_tree):
+    """Test getting environment without additional vars."""
+    root = make_env_tree({".env": "DOTENV_VAR=dotenv-value\n"})
 
-        # Create .env file
-        env_file = tmpdir_path / ".env"
-        env_file.write_text("API_KEY=from-env\nENV_ONLY=env-value\n")
+    # Set system environment variable
+    monkeypatch.setenv("SYSTEM_VAR", "system-value")
 
-        # Create .env.mci file (should take priority, .env not loaded)
-        env_mci_file = tmpdir_path / ".env.mci"
-        env_mci_file.write_text("API_KEY=from-env-mci\nMCI_ONLY=mci-value\n")
+    env_vars = get_env_with_dotenv(root)
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
+    # Should have both .env and system vars
+    assert env_vars["DOTENV_VAR"] == "dotenv-value"
+    assert env_vars["SYSTEM_VAR"] == "system-value"
 
-        # Only .env.mci should be loaded
-        assert env_vars["API_KEY"] == "from-env-mci"
-        assert "ENV_ONLY" not in env_vars  # .env is not loaded
-        assert env_vars["MCI_ONLY"] == "mci-value"
 
+def test_env_mci_priority_over_env(make_env_tree):
+    """Test that when .env.mci files exist, .env files are not loaded."""
+    root = make_env_tree(
+        {
+            ".env": "API_KEY=from-env\nENV_ONLY=env-value\n",
+            # Should take priority, .env not loaded
+            ".env.mci": "API_KEY=from-env-mci\nMCI_ONLY=mci-value\n",
+        }
+    )
 
-def test_mci_env_mci_priority():
-    """Test that when ./mci/.env.mci exists, ./mci/.env is not loaded."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    env_vars = find_and_merge_dotenv_files(root)
 
-        # Create mci directory
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
+    # Only .env.mci should be loaded
+    assert env_vars["API_KEY"] == "from-env-mci"
+    assert "ENV_ONLY" not in env_vars  # .env is not loaded
+    assert env_vars["MCI_ONLY"] == "mci-value"
 
-        # Create ./mci/.env
-        mci_env = mci_dir / ".env"
-        mci_env.write_text("SHARED_KEY=from-mci-env\nMCI_ENV_ONLY=mci-env\n")
 
-        # Create ./mci/.env.mci (should take priority, ./mci/.env not loaded)
-        mci_env_mci = mci_dir / ".env.mci"
-        mci_env_mci.write_text("SHARED_KEY=from-mci-env-mci\nMCI_MCI_ONLY=mci-mci\n")
+def test_mci_env_mci_priority(make_env_tree):
+    """Test that when ./mci/.env.mci exists, ./mci/.env is not loaded."""
+    root = make_env_tree(
+        {
+            "mci/.env": "SHARED_KEY=from-mci-env\nMCI_ENV_ONLY=mci-env\n",
+            # Should take priority, ./mci/.env not loaded
+            "mci/.env.mci": "SHARED_KEY=from-mci-env-mci\nMCI_MCI_ONLY=mci-mci\n",
+        }
+    )
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
+    env_vars = find_and_merge_dotenv_files(root)
 
-        # Only ./mci/.env.mci should be loaded
-        assert env_vars["SHARED_KEY"] == "from-mci-env-mci"
-        assert "MCI_ENV_ONLY" not in env_vars  # ./mci/.env is not loaded
-        assert env_vars["MCI_MCI_ONLY"] == "mci-mci"
+    # Only ./mci/.env.mci should be loaded
+    assert env_vars["SHARED_KEY"] == "from-mci-env-mci"
+    assert "MCI_ENV_ONLY" not in env_vars  # ./mci/.env is not loaded
+    assert env_vars["MCI_MCI_ONLY"] == "mci-mci"
 
 
-def test_full_precedence_with_env_mci():
+def test_full_precedence_with_env_mci(make_env_tree):
     """Test precedence order when .env.mci files exist (only .env.mci files loaded)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Create mci directory
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
-
-        # These .env files should NOT be loaded when .env.mci files exist
-        mci_env = mci_dir / ".env"
-        mci_env.write_text("KEY=mci-env\nMCI_ENV=1\n")
-        root_env = tmpdir_path / ".env"
-        root_env.write_text("KEY=root-env\nROOT_ENV=3\n")
-
-        # These .env.mci files SHOULD be loaded
-        mci_env_mci = mci_dir / ".env.mci"
-        mci_env_mci.write_text("KEY=mci-env-mci\nMCI_MCI=2\n")
-        root_env_mci = tmpdir_path / ".env.mci"
-        root_env_mci.write_text("KEY=root-env-mci\nROOT_MCI=4\n")
-
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
-
-        # root .env.mci should win for KEY
-        assert env_vars["KEY"] == "root-env-mci"
-        # .env files should not be loaded
-        assert "MCI_ENV" not in env_vars
-        assert "ROOT_ENV" not in env_vars
-        # Only .env.mci files loaded
-        assert env_vars["MCI_MCI"] == "2"
-        assert env_vars["ROOT_MCI"] == "4"
-
-
-def test_env_mci_only_in_root():
-    """Test .env.mci works when only in root directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    root = make_env_tree(
+        {
+            # These .env files should NOT be loaded when .env.mci files exist
+            "mci/.env": "KEY=mci-env\nMCI_ENV=1\n",
+            ".env": "KEY=root-env\nROOT_ENV=3\n",
+            # These .env.mci files SHOULD be loaded
+            "mci/.env.mci": "KEY=mci-env-mci\nMCI_MCI=2\n",
+            ".env.mci": "KEY=root-env-mci\nROOT_MCI=4\n",
+        }
+    )
+
+    env_vars = find_and_merge_dotenv_files(root)
 
-        # Create only .env.mci in root
-        root_env_mci = tmpdir_path / ".env.mci"
-        root_env_mci.write_text("MCI_VAR=mci-root\n")
+    # root .env.mci should win for KEY
+    assert env_vars["KEY"] == "root-env-mci"
+    # .env files should not be loaded
+    assert "MCI_ENV" not in env_vars
+    assert "ROOT_ENV" not in env_vars
+    # Only .env.mci files loaded
+    assert env_vars["MCI_MCI"] == "2"
+    assert env_vars["ROOT_MCI"] == "4"
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
 
-        assert env_vars["MCI_VAR"] == "mci-root"
+def test_env_mci_only_in_root(make_env_tree):
+    """Test .env.mci works when only in root directory."""
+    root = make_env_tree({".env.mci": "MCI_VAR=mci-root\n"})
 
+    env_vars = find_and_merge_dotenv_files(root)
 
-def test_env_mci_only_in_mci_dir():
-    """Test .env.mci works when only in ./mci directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    assert env_vars["MCI_VAR"] == "mci-root"
 
-        # Create mci directory
-        mci_dir = tmpdir_path / "mci"
-        mci_dir.mkdir()
 
-        # Create only .env.mci in ./mci
-        mci_env_mci = mci_dir / ".env.mci"
-        mci_env_mci.write_text("MCI_VAR=mci-lib\n")
+def test_env_mci_only_in_mci_dir(make_env_tree):
+    """Test .env.mci works when only in ./mci directory."""
+    root = make_env_tree({"mci/.env.mci": "MCI_VAR=mci-lib\n"})
 
-        env_vars = find_and_merge_dotenv_files(tmpdir_path)
+    env_vars = find_and_merge_dotenv_files(root)
 
-        assert env_vars["MCI_VAR"] == "mci-lib"
+    assert env_vars["MCI_VAR"] == "mci-lib"
@@ -5,6 +5,7 @@ Tests error and warning formatting utilities for CLI display.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from io import StringIO
 
 from rich.console import Console
@@ -17,24 +18,32 @@ from mci.utils.error_formatter import (
 
 
 @pytest.fixture
-def formatter():
-    """Create an ErrorFormatter with StringIO console for testing."""
-    console = Console(file=StringIO(), force_terminal=True)
+def output_buffer():
+    """Buffer that captures everything the formatter prints."""
+    return StringIO()
+
+
+@pytest.fixture
+def formatter(output_buffer):
+    """Create an ErrorFormatter writing plain, uncoloured text to output_buffer."""
+    console = Console(
+        file=output_buffer, force_terminal=False, no_color=True, highlight=False, width=120
+    )
     return ErrorFormatter(console)
 
 
-def test_format_validation_errors_with_single_error(formatter):
+def test_format_validation_errors_with_single_error(formatter, output_buffer):
     """Test formatting a single validation error."""
     errors = [ValidationError(message="Missing required field: name")]
     formatter.format_validation_errors(errors)
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "❌ Validation Errors" in output
     assert "Missing required field: name" in output
     assert "Schema Validation Failed" in output
 
 
-def test_format_validation_errors_with_multiple_errors(formatter):
+def test_format_validation_errors_with_multiple_errors(formatter, output_buffer):
     """Test formatting multiple validation errors."""
     errors = [
         ValidationError(message="Missing required field: name"),
@@ -42,22 +51,22 @@ def test_format_validation_errors_with_multiple_errors(formatter):
     ]
     formatter.format_validation_errors(errors)
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "❌ Validation Errors" in output
     assert "Missing required field: name" in output
     assert "Invalid type for field: age" in output
     assert "[tools[0]]" in output
 
 
-def test_format_validation_errors_with_empty_list(formatter):
+def test_format_validation_errors_with_empty_list(formatter, output_buffer):
     """Test formatting with empty error list (should not output anything)."""
     formatter.format_validation_errors([])
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert output == ""
 
 
-def test_format_validation_warnings_with_single_warning(formatter):
+def test_format_validation_warnings_with_single_warning(formatter, output_buffer):
     """Test formatting a single validation warning."""
     warnings = [
         ValidationWarning(
@@ -67,45 +76,45 @@ def test_format_validation_warnings_with_single_warning(formatter):
     ]
     formatter.format_validation_warnings(warnings)
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "⚠️  Validation Warnings" in output
     assert "Toolset file not found" in output
     assert "💡 Create the file or update your schema" in output
 
 
-def test_format_validation_warnings_with_no_suggestion(formatter):
+def test_format_validation_warnings_with_no_suggestion(formatter, output_buffer):
     """Test formatting a warning without suggestion."""
     warnings = [ValidationWarning(message="Potential issue detected")]
     formatter.format_validation_warnings(warnings)
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "⚠️  Validation Warnings" in output
     assert "Potential issue detected" in output
 
 
-def test_format_validation_warnings_with_empty_list(formatter):
+def test_format_validation_warnings_with_empty_list(formatter, output_buffer):
     """Test formatting with empty warning list (should not output anything)."""
     formatter.format_validation_warnings([])
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert output == ""
 
 
-def test_format_validation_success(formatter):
+def test_format_validation_success(formatter, output_buffer):
     """Test formatting validation success message."""
     formatter.format_validation_success("mci.json")
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "✅ Schema is valid!" in output
     assert "File: mci.json" in output
     assert "Validation Successful" in output
 
 
-def test_format_mci_error(formatter):
+def test_format_mci_error(formatter, output_buffer):
     """Test formatting an MCI error message."""
     formatter.format_mci_error("Failed to load schema: Invalid JSON")
     
-    output = formatter.console.file.getvalue()  # type: ignore[attr-defined]
+    output = output_buffer.getvalue()
     assert "❌ MCI Error" in output
     assert "Failed to load schema: Invalid JSON" in output
 
@@ -145,3 +154,14 @@ def test_validation_warning_without_suggestion():
     warning = ValidationWarning(message="Test warning")
     assert warning.message == "Test warning"
     assert warning.suggestion is None
+
+
+def test_validation_issues_are_frozen_and_hashable():
+    """Test ValidationError and ValidationWarning are immutable value objects."""
+    error = ValidationError(message="Test error", location="tools[0]")
+
+    with pytest.raises(FrozenInstanceError):
+        error.message = "Changed"  # type: ignore[misc]
+
+    assert len({error, ValidationError(message="Test error", location="tools[0]")}) == 1
+    assert len({ValidationWarning(message="Warn"), ValidationWarning(message="Warn")}) == 1
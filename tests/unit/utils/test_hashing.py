@@ -0,0 +1,33 @@
+"""
+Unit tests for hashing utilities.
+
+Tests the stable digests used as in-process cache keys.
+"""
+
+import pytest
+
+from mci.utils.hashing import schema_digest
+
+
+def test_schema_digest_ignores_key_order():
+    """Test that nested key order does not change the digest."""
+    first = {"type": "object", "properties": {"a": {"type": "string"}, "b": {"type": "number"}}}
+    second = {"properties": {"b": {"type": "number"}, "a": {"type": "string"}}, "type": "object"}
+
+    assert schema_digest(first) == schema_digest(second)
+    assert len(schema_digest(first)) == 16
+
+
+def test_schema_digest_distinguishes_values():
+    """Test that different content yields different digests."""
+    assert schema_digest({"required": ["a"]}) != schema_digest({"required": ["b"]})
+    assert schema_digest(None) != schema_digest({})
+
+
+def test_schema_digest_rejects_circular_data():
+    """Test that unencodable data raises instead of producing a key."""
+    data: dict = {}
+    data["self"] = data
+
+    with pytest.raises((TypeError, ValueError)):
+        schema_digest(data)